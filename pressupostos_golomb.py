@@ -33,15 +33,28 @@ except ImportError:
     print("⚠️  Este script usa cores. Por favor, instale 'colorama' com 'py -m pip install colorama' no propt de comando")
     Fore = Style = type('', (), {'GREEN':'', 'RED':'', 'RESET_ALL':''})()
 
+import sys
 from math import log, log10
-from re import findall
-from collections import defaultdict
-from random import randint
-
-debug = True
-def debug_print(message: str):
-    if debug:
-        print(message)
+from bisect import bisect_left
+from functools import lru_cache
+from collections import Counter
+from itertools import accumulate, compress, groupby
+from operator import eq, ne
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count, environ, urandom
+
+# BITSTREAM_DEBUG=0 desliga as mensagens de depuração (ligadas por omissão)
+debug = environ.get('BITSTREAM_DEBUG', '1') != '0'
+# Decidido uma vez ao importar: sem debug, as chamadas não fazem nada. Nos ciclos das verificações
+# as mensagens ficam também atrás de `if debug:`, para que as f-strings nem sejam montadas.
+debug_print = print if debug else lambda message: None
+# Com BITSTREAM_CACHE=1, pedidos repetidos de geração com os mesmos pressupostos e comprimento reutilizam a sequência
+cache_sequences = environ.get('BITSTREAM_CACHE') == '1'
+
+_DELETE_BINARY_DIGITS = str.maketrans('', '', '01')
+SEPARATOR = '-' * 50
+_ERR_PREFIX = f'⚠️  {Fore.RED}Valor inválido: {Style.RESET_ALL}"'
+_YES = frozenset('SsYy')
 
 
 #BASES
@@ -53,6 +66,8 @@ def gettin_sequence_basics(sequence: str) -> tuple[dict, dict, dict, dict]:
     :Note:
     - A sequência já deve ter sido validada como binária antes de ser passada para esta função.
     - Os dados retornados são fundamentais para análise posterior dos pressupostos de Golomb.
+    - Os bits são lidos uma única vez (em `separete_runs`); tudo o resto é derivado dos tamanhos dos blocos.
+    - `run_frequencies` é contado uma só vez e partilhado pelos pressupostos 2 e 3; as verificações não voltam a contar blocos.
 
     :param sequence: Sequência binária (apenas 0s e 1s)
     :type sequence: str
@@ -63,17 +78,20 @@ def gettin_sequence_basics(sequence: str) -> tuple[dict, dict, dict, dict]:
     >>> gettin_sequence_basics("100101110010")
     (
         {'all': 12, 'zeros': 5, 'ones': 7},                           #num_bits
-        {'all': ['1', '00', '1', ...], 'zeros': [...], 'ones': [...]},      #runs
+        {'lengths': [1, 2, 1, 1, ...], 'first_bit': 1},                     #runs
         {'all': {1: 6, 2: 2, 3: 1}, 'zeros': {...}, 'ones': {...}},         #run_frequencies
         {'all': [1, 2, 1, 1, ...], 'zeros': [...], 'ones': [...]}           #ordered_run_sizes
     )
     """
     debug_print('\n📖 Obtendo as bases da sequencia')
 
-    num_bits = count_bits(sequence)
     runs = separete_runs(sequence)
-    run_frequencies = count_run_lengths(runs)
     ordered_run_sizes = run_sizes_in_order(runs)
+    num_zeros = sum(ordered_run_sizes['zeros'])
+    num_ones = sum(ordered_run_sizes['ones'])
+
+    num_bits = {'all': num_zeros + num_ones, 'zeros': num_zeros, 'ones': num_ones}
+    run_frequencies = count_run_lengths(ordered_run_sizes['zeros'], ordered_run_sizes['ones'])
 
     return [num_bits, runs, run_frequencies, ordered_run_sizes]
 #
@@ -83,8 +101,8 @@ def count_bits(sequence: str) -> dict[str, int]:
     Retorna um dicionário com o total de bits, o número de zeros e o número de uns.
 
     :Note:
-    - A sequência deve conter apenas caracteres '0' e '1'.
-    - Outros caracteres serão ignorados e não contabilizados.
+    - A sequência deve conter apenas caracteres '0' e '1' (já validada por `verify_sequence`).
+    - Apenas os uns são contados; os zeros são o restante do comprimento, evitando uma segunda passagem.
 
     :param sequence: Sequência binária como string (ex: '100101')
     :type sequence: str
@@ -96,61 +114,114 @@ def count_bits(sequence: str) -> dict[str, int]:
     {'all': 9, 'zeros': 4, 'ones': 5}
     """
     debug_print('\t1️⃣  Contando o número de bits')
-    num_zeros = sequence.count('0')
     num_ones = sequence.count('1')
+    num_zeros = len(sequence) - num_ones
     return {'all': num_zeros+num_ones, 'zeros': num_zeros, 'ones': num_ones}
 #
-def separete_runs(sequence: str) -> dict[str, list[str]]:
+def separete_runs(sequence: str) -> dict[str, list[int] | int]:
     """
-    Separa uma sequência binária em blocos consecutivos de zeros e uns, 
-    retornando um dicionário com listas desses blocos.
+    Separa uma sequência binária em blocos consecutivos de zeros e uns.
+    Os blocos são guardados apenas pelo seu tamanho e pelo bit do primeiro bloco, já que alternam entre 0 e 1.
     
     :Note:
     A função pressupõe que a sequência fornecida contenha apenas os caracteres '0' e '1'.
     Se forem incluídos outros caracteres, o comportamento pode ser imprevisível.
+    As strings dos blocos só são reconstruídas quando necessárias, através de `get_run_blocks`.
 
     :param sequence: string de sequência de bits
     :type sequence: str
-    :return: dicionário com 3 listas — 'all': lista com todos os blocos; 
-             'zeros': lista apenas com os blocos de zeros; 'ones': lista apenas com os blocos de uns
-    :rtype: dict[str, list[str]]
+    :return: dicionário com 'lengths': tamanhos de todos os blocos pela ordem da sequência;
+             'first_bit': bit (0 ou 1) do primeiro bloco
+    :rtype: dict[str, list[int] | int]
 
     :Example:
     >>> runs = separete_runs('100110101')
-    >>> runs['all']
+    >>> runs
+    {'lengths': [1, 2, 2, 1, 1, 1, 1], 'first_bit': 1}
+    >>> get_run_blocks(runs)
     ['1', '00', '11', '0', '1', '0', '1']
-    >>> runs['zeros']
-    ['00', '0', '0']
-    >>> runs['ones']
-    ['1', '11', '1', '1']
     """
     debug_print('\t2️⃣  Separarando a sequência por blocos')
-    runs = findall(r'0+|1+', sequence)
-    runs_zero = []
-    runs_one = []
+    lengths, first_bit = _run_lengths(sequence)
+    return {'lengths': lengths, 'first_bit': first_bit}
+#
+def get_run_blocks(runs: dict, start: int = 0, end: int | None = None) -> list[str]:
+    """
+    Reconstrói as strings dos blocos entre as posições `start` e `end` (como numa fatia de lista).
 
-    for run in runs:
-        if run[0] == '0':
-            runs_zero.append(run)
-        if run[0] == '1':
-            runs_one.append(run)
+    :Note:
+    - Usado apenas para apresentar blocos em mensagens e no resultado final; as verificações trabalham sobre os tamanhos.
+    - O bit de cada bloco é dado por `first_bit` e pela paridade da sua posição.
 
-    return {
-        "all": runs, 
-        "zeros": runs_zero,
-        "ones": runs_one
-    }
+    :param runs: Dicionário com 'lengths' e 'first_bit' (gerado por `separete_runs()` ou `gettin_sequence_basics()`)
+    :type runs: dict
+    :param start: Posição do primeiro bloco (não negativa)
+    :type start: int
+    :param end: Posição a seguir ao último bloco; None para ir até ao fim
+    :type end: int | None
+    :return: Lista com as strings dos blocos pedidos
+    :rtype: list[str]
+
+    :Example:
+    >>> runs = {'lengths': [1, 2, 2, 1, 1, 1, 1], 'first_bit': 1}
+    >>> get_run_blocks(runs, 1, 4)
+    ['00', '11', '0']
+    """
+    bit = runs['first_bit'] ^ (start & 1)
+    bits = ('0', '1') if bit == 0 else ('1', '0')
+    return [bits[index % 2] * length for index, length in enumerate(runs['lengths'][start:end])]
 #
-def count_run_lengths(runs: dict) -> dict[dict[int, int]]:
+def _run_lengths(sequence: str) -> tuple[list[int], int]:
     """
-    Conta a frequência com que diferentes tamanhos de blocos ocorrem na sequência, separados por tipo (todos, apenas zeros, apenas uns).
+    Calcula, numa única passagem, o tamanho de cada bloco consecutivo da sequência e o bit do primeiro bloco.
 
     :Note:
-    A função espera que `runs` seja um dicionário retornado pela função `separete_runs`, contendo listas de blocos.
-    Não é necessário verificar a validade da sequência neste ponto, pois presume-se que isso já tenha sido feito anteriormente.
+    - Cada fronteira é encontrada com `str.find` do bit oposto, por isso o trabalho em Python é proporcional ao
+      número de blocos e não ao número de bits, e nenhuma substring é criada.
+    - Como os blocos alternam, o bit de cada bloco é dado pela paridade do seu índice e por `first_bit`.
+
+    :param sequence: Sequência binária (apenas 0s e 1s)
+    :type sequence: str
+    :return: lista com os tamanhos dos blocos pela ordem da sequência e o bit (0 ou 1) do primeiro bloco
+    :rtype: tuple[list[int], int]
 
-    :param runs: Dicionário com as listas de blocos separados da sequência, incluindo todos, zeros e uns.
-    :type runs: dict[str, list[str]]
+    :Example:
+    >>> _run_lengths('100110101')
+    ([1, 2, 2, 1, 1, 1, 1], 1)
+    """
+    lengths = []
+    if not sequence:
+        return lengths, 0
+
+    first_bit = int(sequence[0])
+    find = sequence.find
+    bit, other = ('0', '1') if first_bit == 0 else ('1', '0')
+    start = 0
+
+    # Cada fronteira é a próxima ocorrência do bit oposto; o último bloco termina no fim da sequência
+    end = find(other, start)
+    while end != -1:
+        lengths.append(end - start)
+        start = end
+        bit, other = other, bit
+        end = find(other, start)
+    lengths.append(len(sequence) - start)
+
+    return lengths, first_bit
+#
+def count_run_lengths(zero_lengths: list[int], one_lengths: list[int]) -> dict[dict[int, int]]:
+    """
+    Conta a frequência com que diferentes tamanhos de blocos ocorrem na sequência, separados por tipo (todos, apenas zeros, apenas uns).
+
+    :Note:
+    A função espera os tamanhos dos blocos de zeros e de uns tal como obtidos por `run_sizes_in_order`.
+    A contagem é feita por `Counter`, em C, sem um ciclo Python por bloco; 'all' é a soma das duas contagens.
+    Os tamanhos distintos são ordenados uma só vez e os três dicionários são construídos diretamente nessa ordem.
+
+    :param zero_lengths: Tamanhos dos blocos de zeros, pela ordem da sequência.
+    :type zero_lengths: list[int]
+    :param one_lengths: Tamanhos dos blocos de uns, pela ordem da sequência.
+    :type one_lengths: list[int]
     :return: Dicionário com 3 subdicionários:
         - 'all': frequência de todos os blocos por tamanho
         - 'zeros': frequência dos blocos de zeros por tamanho
@@ -158,38 +229,26 @@ def count_run_lengths(runs: dict) -> dict[dict[int, int]]:
     :rtype: dict[str, dict[int, int]]
 
     :Example:
-    >>> runs = {
-    ...     'all': ['1', '00', '11', '0', '1', '0', '1'],
-    ...     'zeros': ['00', '0', '0'],
-    ...     'ones': ['1', '11', '1', '1']
-    ... }
-    >>> count_run_lengths(runs)
+    >>> count_run_lengths([2, 1, 1], [1, 2, 1, 1])
     {
         'all': {1: 5, 2: 2},
         'zeros': {1: 2, 2: 1},
         'ones': {1: 3, 2: 1}
     }
 
-    >>> list(count_run_lengths(runs)['ones'].values())
+    >>> list(count_run_lengths([2, 1, 1], [1, 2, 1, 1])['ones'].values())
     [3, 1]
     """
     debug_print('\t3️⃣  Calculando a frequencia de cada bloco')
-    run_counts = defaultdict(int)
-    run_counts_zero = defaultdict(int)
-    run_counts_one = defaultdict(int)
-
-    for run in runs['zeros']:
-        run_counts[len(run)] += 1
-        run_counts_zero[len(run)] += 1
-
-    for run in runs['ones']:
-        run_counts_one[len(run)] += 1
-        run_counts[len(run)] += 1
-        
+    run_counts_zero = Counter(zero_lengths)
+    run_counts_one = Counter(one_lengths)
+    # Uma única ordenação dos tamanhos existentes serve para construir os 3 dicionários já ordenados
+    sizes = sorted(run_counts_zero.keys() | run_counts_one.keys())
+
     return {
-        "all": dict(sorted(run_counts.items())),
-        "zeros": dict(sorted(run_counts_zero.items())),
-        "ones": dict(sorted(run_counts_one.items()))
+        "all": {size: run_counts_zero[size] + run_counts_one[size] for size in sizes},
+        "zeros": {size: run_counts_zero[size] for size in sizes if size in run_counts_zero},
+        "ones": {size: run_counts_one[size] for size in sizes if size in run_counts_one}
     }
 #
 def run_sizes_in_order(runs: dict) -> dict[str, list[int]]:
@@ -198,9 +257,10 @@ def run_sizes_in_order(runs: dict) -> dict[str, list[int]]:
 
     :Note:
     A função presume que a entrada foi gerada pela função `separete_runs`, portanto não realiza validações adicionais sobre o conteúdo.
+    Como os blocos alternam, os tamanhos de zeros e de uns são fatias de 2 em 2 de 'lengths', sem ciclos em Python.
 
-    :param runs: Dicionário com listas de blocos separados da sequência, incluindo 'all', 'zeros' e 'ones'.
-    :type runs: dict[str, list[str]]
+    :param runs: Dicionário com os tamanhos de todos os blocos ('lengths') e o bit do primeiro bloco ('first_bit').
+    :type runs: dict
     :return: Dicionário com listas de inteiros representando os tamanhos dos blocos na ordem da sequência:
         - 'all': tamanhos de todos os blocos
         - 'zeros': tamanhos dos blocos de zero
@@ -208,11 +268,7 @@ def run_sizes_in_order(runs: dict) -> dict[str, list[int]]:
     :rtype: dict[str, list[int]]
 
     :Example:
-    >>> runs = {
-    ...     'all': ['1', '00', '11', '0', '1', '0', '1'],
-    ...     'zeros': ['00', '0', '0'],
-    ...     'ones': ['1', '11', '1', '1']
-    ... }
+    >>> runs = {'lengths': [1, 2, 2, 1, 1, 1, 1], 'first_bit': 1}
     >>> run_sizes_in_order(runs)
     {
         'all': [1, 2, 2, 1, 1, 1, 1],
@@ -221,26 +277,18 @@ def run_sizes_in_order(runs: dict) -> dict[str, list[int]]:
     }
     """
     debug_print('\t4️⃣  Colocando o tamanho dos blocos por ordem da sequencia')
-    run_sizes = []
-    run_sizes_zero = []
-    run_sizes_one = []
-
-    for run in runs['all']:
-        run_sizes.append(len(run))
-    for run in runs['zeros']:
-        run_sizes_zero.append(len(run))
-    for run in runs['ones']:
-        run_sizes_one.append(len(run))
+    lengths = runs['lengths']
+    first_bit = runs['first_bit']
 
     return {
-        'all': run_sizes,
-        'zeros': run_sizes_zero,
-        'ones': run_sizes_one
+        'all': lengths,
+        'zeros': lengths[first_bit::2],
+        'ones': lengths[1 - first_bit::2]
     }
 
 
 #1 GOLOMB
-def check_first_postulate(num_bits: dict, postulates: dict) -> list[dict, float, float, float]:
+def check_first_postulate(num_bits: dict, postulates: dict, min_percentage: float = None) -> list[dict, float, float, float]:
     """
     Verifica se a sequência cumpre o primeiro pressuposto de Golomb com base na percentagem de bits 0 e 1.
 
@@ -253,6 +301,8 @@ def check_first_postulate(num_bits: dict, postulates: dict) -> list[dict, float,
     :type num_bits: dict[str, int]
     :param postulates: dicionário que armazena o estado dos pressupostos
     :type postulates: dict[int, dict[str, Any]]
+    :param min_percentage: percentagem mínima já calculada para este comprimento; se omitida, é obtida de `get_min_percentage`
+    :type min_percentage: float
 
     :return: lista contendo o dicionário `postulates` atualizado, o valor mínimo de percentagem aceitável, a percentagem de 0's e de 1's
     :rtype: list[dict, float, float, float]
@@ -272,7 +322,8 @@ def check_first_postulate(num_bits: dict, postulates: dict) -> list[dict, float,
     percent_zero = round(n_zeros / length * 100, 2)
     percent_one = round(n_ones / length * 100, 2)
 
-    min_percentage = get_min_percentage(length)
+    if min_percentage is None:
+        min_percentage = get_min_percentage(length)
     debug_print(f'\t📐 Erro minimo calculado - {min_percentage}%')
 
     for percentage in [percent_zero, percent_one]:
@@ -290,6 +341,7 @@ def check_first_postulate(num_bits: dict, postulates: dict) -> list[dict, float,
 
     return [postulates, min_percentage , percent_zero, percent_one]
 #
+@lru_cache(maxsize=4096)
 def get_min_percentage(length: int) -> float:
     """
     Retorna a percentagem mínima aceitável de bits 0 ou 1 numa sequência, com base no seu comprimento.
@@ -300,6 +352,7 @@ def get_min_percentage(length: int) -> float:
     - Entre 10 e 20 bits: crescimento linear de 40% a 45%
     - Entre 21 e 1000 bits: fórmula logarítmica (natural) que garante equilíbrio crescente
     - > 1000 bits: 49%
+    - O resultado depende apenas do comprimento, por isso fica em cache (`lru_cache`) entre chamadas.
 
     :param length: comprimento total da sequência
     :type length: int
@@ -365,8 +418,6 @@ def check_second_postulate(run_frequencies: dict, postulates: dict) -> dict[list
     """
     debug_print('\n🔍 Iniciando verificação de pressuposto 2')
     run_counts = list(run_frequencies['all'].values())
-    warnings = []
-
     comply, relevants, warnings = verify_frequency_runs(run_counts)
 
     postulates[2]['comply'] = comply
@@ -408,16 +459,22 @@ def verify_frequency_runs(run_counts: list) -> tuple[bool, list[str], list[str]]
     debug_print('  🛠️  Verificando frequência de blocos')
     relevants = []
     warnings = []
-    comply = True
-
-    for size, (i1, i2) in enumerate(zip(run_counts, run_counts[1:])):
-        if i1 <= i2:
-            comply = False
-            relevants.append(f"Blocos de tamanho {size+1} ({i1}) não são mais frequentes que de tamanho {size+2} ({i2})")
-            debug_print(f'\t⚠️  Encontrado tamanhos superiores com maior frequência ({i1} < {i2})')
-        elif i1 * 0.8 <= i2:
-            warnings.append(f"Frequência de blocos tamanho {size+1} muito próxima de {size+2} ({i1} vs {i2})")
-            debug_print(f'\t🧭 Encontrado frequências de blocos próximas ({i1} vs {i2})')
+    pairs = list(zip(run_counts, run_counts[1:]))
+
+    # Primeiro só se marcam os índices com problemas; as mensagens são criadas apenas para esses
+    # (i1 * 8 <= i2 * 10 é o mesmo que i1 * 0.8 <= i2, mas em inteiros)
+    inverted = [size for size, (i1, i2) in enumerate(pairs) if i1 <= i2]
+    close = [size for size, (i1, i2) in enumerate(pairs) if i2 < i1 and i1 * 8 <= i2 * 10]
+    comply = not inverted
+
+    for size in inverted:
+        i1, i2 = pairs[size]
+        relevants.append(f"Blocos de tamanho {size+1} ({i1}) não são mais frequentes que de tamanho {size+2} ({i2})")
+        if debug: debug_print(f'\t⚠️  Encontrado tamanhos superiores com maior frequência ({i1} < {i2})')
+    for size in close:
+        i1, i2 = pairs[size]
+        warnings.append(f"Frequência de blocos tamanho {size+1} muito próxima de {size+2} ({i1} vs {i2})")
+        if debug: debug_print(f'\t🧭 Encontrado frequências de blocos próximas ({i1} vs {i2})')
 
     if comply:
         if not warnings:
@@ -442,13 +499,13 @@ def check_third_postulate(run_frequencies: dict, ordered_run_sizes: dict, runs:
     :Note:
     Esta função assume que os dados fornecidos foram gerados pelas funções auxiliares apropriadas:
     'run_frequencies' (via 'count_run_lengths()'), 'ordered_run_sizes' (via 'run_sizes_in_order()'),
-    'runs' (via 'separate_runs()'), e que o dicionário 'postulates' já contém a estrutura esperada.
+    'runs' (via 'separete_runs()'), e que o dicionário 'postulates' já contém a estrutura esperada.
 
     :param run_frequencies: Frequência de ocorrência de blocos por tamanho.
     :type run_frequencies: dict
     :param ordered_run_sizes: Tamanhos dos blocos na ordem da sequência.
     :type ordered_run_sizes: dict
-    :param runs: Lista dos blocos de 0s e 1s encontrados na sequência.
+    :param runs: Tamanhos dos blocos de 0s e 1s e bit do primeiro bloco.
     :type runs: dict
     :param postulates: Dicionário onde os resultados dos pressupostos são armazenados.
     :type postulates: dict
@@ -457,11 +514,7 @@ def check_third_postulate(run_frequencies: dict, ordered_run_sizes: dict, runs:
 
     :Example:
     >>> sequencia = '00010010100000'
-    >>> runs = {
-    ...     'all': ['000', '1', '00', '1', '0', '1', '00000'],
-    ...     'zeros': ['000', '00', '0', '00000'],
-    ...     'ones': ['1', '1', '1']
-    ... }
+    >>> runs = {'lengths': [3, 1, 2, 1, 1, 1, 5], 'first_bit': 0}
     >>> ordered_run_sizes = {
     ...     'all': [3, 1, 2, 1, 1, 1, 5],
     ...     'zeros': [3, 2, 1, 5],
@@ -523,7 +576,7 @@ def verify_sizes_patterns(runs: dict, ordered_run_sizes: dict) -> tuple[bool, li
     - Ignora padrões compostos apenas por blocos de tamanho 1.
     - Relevantes impactam diretamente na validação do pressuposto; warnings são alertas secundários.
 
-    :param runs: Dicionário contendo os blocos separados da sequência.
+    :param runs: Dicionário com os tamanhos dos blocos ('lengths') e o bit do primeiro bloco ('first_bit').
     :type runs: dict
     :param ordered_run_sizes: Dicionário com os tamanhos dos blocos, na ordem original da sequência.
     :type ordered_run_sizes: dict
@@ -535,7 +588,7 @@ def verify_sizes_patterns(runs: dict, ordered_run_sizes: dict) -> tuple[bool, li
 
     :Example:
     >>> sequencia = '1001101001010'
-    >>> runs = {'all': ['1', '00', '11', '0', '1', '00', '1', '0', '1', '0'], ...}
+    >>> runs = {'lengths': [1, 2, 2, 1, 1, 2, 1, 1, 1, 1], 'first_bit': 1}
     >>> ordered_run_sizes = {'all': [1, 2, 2, 1, 1, 2, 1, 1, 1, 1], ...}
     >>> comply, relevants, warnings = verify_sizes_patterns(runs, ordered_run_sizes)
     >>> comply
@@ -549,61 +602,38 @@ def verify_sizes_patterns(runs: dict, ordered_run_sizes: dict) -> tuple[bool, li
     comply = True
     relevants = []
     warnings = []
-    count_groups = {}
-    len_runs_sizes = len(runs['all'])
-
-    for size_groups_run in range(2, len_runs_sizes):
-
-        if size_groups_run == 2:
-            for start in range(len_runs_sizes-3):
-                end = start +2
-                try:
-                    group = ' '.join(runs['all'][start : end])
-                    next_group = ' '.join(runs['all'][start +2 : end +2])
-
-                    if len(group) == 2:
-                        continue
-                    if group == next_group:
-                        comply = False
-                        relevants.append(f'Bloco [{group}] repete-se sucessivamente')
-                        debug_print(f'\t⚠️  Bloco [{group}] repete-se sucessivamente')
-
-                except IndexError:
-                    break
-      
-        if size_groups_run > 2:
-            groups_to_scan = len_runs_sizes - size_groups_run +1
-
-            for index_group in range(groups_to_scan):
-                start_group = index_group
-                end_group = start_group + size_groups_run
-                group = ordered_run_sizes['all'][start_group : end_group]
-                group_str = ', '.join(str(run) for run in group)
-                
-                if group_str in count_groups.keys():
-                    count_groups[group_str] += 1
-                else:
-                    count_groups[group_str] = 1
+    sizes = ordered_run_sizes['all']
+
+    # Os blocos alternam entre 0 e 1, logo os blocos i e i+2 têm o mesmo bit e
+    # dois pares de blocos são iguais sempre que os seus tamanhos o forem
+    quads = zip(sizes, sizes[1:], sizes[2:], sizes[3:])
+    for start, (size_1, size_2, next_size_1, next_size_2) in enumerate(quads):
+        if size_1 == next_size_1 and size_2 == next_size_2:
+            group = ' '.join(get_run_blocks(runs, start, start +2))
+            comply = False
+            relevants.append(f'Bloco [{group}] repete-se sucessivamente')
+            if debug: debug_print(f'\t⚠️  Bloco [{group}] repete-se sucessivamente')
 
+    # Somas acumuladas: a soma de qualquer grupo sai em O(1), sem fatiar os tamanhos
+    prefix_sums = list(accumulate(sizes, initial=0))
 
-    for group, qtt in count_groups.items():
-        sizes_in_group = group.split(', ')
-        runs_in_group = len(sizes_in_group)
-        sum_group_sizes = sum([int(size) for size in sizes_in_group])
+    for start, runs_in_group, qtt in _count_size_groups(sizes, 3):
+        sum_group_sizes = prefix_sums[start + runs_in_group] - prefix_sums[start]
 
         if sum_group_sizes > runs_in_group:
+            group = ', '.join(str(size) for size in sizes[start : start + runs_in_group])
             if qtt > 2:
                 comply = False
                 relevants.append(f"Tamanhos de blocos [{group}] repete-se {qtt} vezes.")
-                debug_print(f'\t⚠️  Tamanho de blocos [{group}] repetem-se em excesso')
+                if debug: debug_print(f'\t⚠️  Tamanho de blocos [{group}] repetem-se em excesso')
             elif qtt == 2:
                 if runs_in_group == 3:
                     warnings.append(f"Tamanhos de blocos [{group}] repete-se {qtt} vezes.")
-                    debug_print(f'\t🧭 Tamanho de blocos [{group}] repetem-se com frequência')
+                    if debug: debug_print(f'\t🧭 Tamanho de blocos [{group}] repetem-se com frequência')
                 else:
                     comply = False
                     relevants.append(f"Tamanhos de blocos [{group}] repete-se {qtt} vezes.")
-                    debug_print(f'\t⚠️  Tamanho de blocos [{group}] repetem-se em excesso')
+                    if debug: debug_print(f'\t⚠️  Tamanho de blocos [{group}] repetem-se em excesso')
 
 
     if not (warnings or relevants):
@@ -611,6 +641,55 @@ def verify_sizes_patterns(runs: dict, ordered_run_sizes: dict) -> tuple[bool, li
 
     return [comply, relevants, warnings]
 #
+def _count_size_groups(sizes: list[int], min_group: int) -> list[tuple[int, int, int]]:
+    """
+    Conta quantas vezes cada grupo de tamanhos consecutivos (com pelo menos `min_group` blocos) se repete,
+    devolvendo apenas os grupos que aparecem 2 ou mais vezes.
+
+    :Note:
+    - Um grupo de k blocos só pode repetir-se se o seu prefixo de k-1 blocos também se repetir, por isso cada
+      tamanho de grupo apenas estende as posições que já se repetiam no tamanho anterior.
+    - Cada grupo é identificado por um inteiro (id do prefixo + tamanho seguinte), sem montar strings nem fatias.
+    - A ordem do resultado é a mesma da contagem completa: por tamanho de grupo e depois pela primeira ocorrência.
+    - Cada grupo é devolvido pela sua primeira ocorrência; os tamanhos só são lidos por quem precisar da mensagem.
+
+    :param sizes: Tamanhos dos blocos, na ordem original da sequência.
+    :type sizes: list[int]
+    :param min_group: Menor número de blocos por grupo a incluir no resultado.
+    :type min_group: int
+    :return: Lista de (posição da primeira ocorrência, número de blocos, número de ocorrências) dos grupos repetidos.
+    :rtype: list[tuple[int, int, int]]
+
+    :Example:
+    >>> _count_size_groups([1, 2, 2, 1, 1, 2, 1, 1, 1, 1], 3)
+    [(2, 3, 2), (6, 3, 2)]
+    """
+    len_sizes = len(sizes)
+    count_groups = []
+    group_ids = sizes
+    starts = range(len_sizes)
+
+    for size_group in range(2, len_sizes):
+        groups = {}
+        for start in starts:
+            last = start + size_group - 1
+            if last >= len_sizes:
+                break
+            groups.setdefault((group_ids[start], sizes[last]), []).append(start)
+
+        group_ids = {}
+        for group_id, group_starts in enumerate(group for group in groups.values() if len(group) > 1):
+            for start in group_starts:
+                group_ids[start] = group_id
+            if size_group >= min_group:
+                count_groups.append((group_starts[0], size_group, len(group_starts)))
+
+        if not group_ids:
+            break
+        starts = sorted(group_ids)
+
+    return count_groups
+#
 def verify_excessive_run_frequency(run_frequencies: dict, ordered_run_sizes: dict) -> tuple[bool, list[str], list[str]]:
     """
     Verifica se algum tamanho específico de bloco de 0s ou 1s aparece em excesso na sequência.
@@ -653,26 +732,32 @@ def verify_excessive_run_frequency(run_frequencies: dict, ordered_run_sizes: dic
 
     for bit_type in ['zeros', 'ones']:
         run_counts_dict = run_frequencies[bit_type]
-        total_runs = sum(run_counts_dict.values())
+        # O total de blocos de um tipo é a soma das suas frequências
+        total_runs = len(ordered_run_sizes[bit_type])
 
-        num_blocks = len(ordered_run_sizes[bit_type])
-        if num_blocks == 0: num_bits = 1
+        num_blocks = total_runs
+        if num_blocks == 0: num_blocks = 1
         bit = '0' if bit_type == 'zeros' else '1'
 
-        max_percentage = max(40, 70 - 14 * log10(num_blocks))
-        warning_percentage = max(35, 60 - 14 * log10(num_blocks))
+        # Os limites só dependem do número de blocos, por isso são calculados uma vez por tipo
+        log_blocks = 14 * log10(num_blocks)
+        max_percentage = max(40, 70 - log_blocks)
+        warning_percentage = max(35, 60 - log_blocks)
 
         for size, count in run_counts_dict.items():
             percentage = count / total_runs * 100
+            # max_percentage >= warning_percentage, logo abaixo do aviso não há nada a reportar
+            if percentage < warning_percentage:
+                continue
+
+            block = bit * size
             if percentage > max_percentage:
-                block = bit * size
-                debug_print(f'\t⚠️  Excesso de blocos de [{block}] (~{percentage:.1f}%)')
+                if debug: debug_print(f'\t⚠️  Excesso de blocos de [{block}] (~{percentage:.1f}%)')
                 comply = False
                 relevants.append(f"Muitos blocos de [{block}] (~{percentage:.1f}%)")
 
-            elif percentage >= warning_percentage:
-                block = bit * size
-                debug_print(f'\t🧭  Frequente de blocos de [{block}] (~{percentage:.1f}%)')
+            else:
+                if debug: debug_print(f'\t🧭  Frequente de blocos de [{block}] (~{percentage:.1f}%)')
                 warnings.append(f"Talvez muitos blocos de [{block}] (~{percentage:.1f}%)?")
     
     if not (warnings or relevants):
@@ -696,7 +781,7 @@ def verify_successively_same_size(ordered_run_sizes: dict, runs: dict) -> tuple[
 
     :param ordered_run_sizes: Dicionário com listas ordenadas de tamanhos de blocos por tipo: 'all', 'zeros', 'ones'.
     :type ordered_run_sizes: dict
-    :param runs: Dicionário com os blocos separados em listas por tipo: 'all', 'zeros', 'ones'.
+    :param runs: Dicionário com os tamanhos dos blocos ('lengths') e o bit do primeiro bloco ('first_bit').
     :type runs: dict
     :return: Tupla contendo:
              - 'comply': booleano indicando se a sequência cumpre as regras,
@@ -711,11 +796,7 @@ def verify_successively_same_size(ordered_run_sizes: dict, runs: dict) -> tuple[
     ...     'zeros': [1, 1, 1, 1, 1],
     ...     'ones': [1, 5, 1, 1, 3]
     ... }
-    >>> runs = {
-    ...     'all': ['0', '1', '0', '11111', '0', '1', '0', '1', '0', '111'],
-    ...     'zeros': ['0', '0', '0', '0', '0'],
-    ...     'ones': ['1', '11111', '1', '1', '111']
-    ... }
+    >>> runs = {'lengths': [1, 1, 1, 5, 1, 1, 1, 1, 1, 3], 'first_bit': 0}
     >>> comply, relevants, warnings = verify_successively_same_size(ordered_run_sizes, runs)
     >>> comply
     False
@@ -726,50 +807,72 @@ def verify_successively_same_size(ordered_run_sizes: dict, runs: dict) -> tuple[
     """
     debug_print('  🛠️  Verificando tamanho de blocos iguais sucessivos')
     comply = True
-    warnings = {}
-    relevants = {}
+    warnings = []
+    relevants = []
 
     def warning_result(bit, run_sizes, index, count, level):
         sign2 = '⚠️' if level == 1 else '🧭'
         if bit == 'all':
-            content = ', '.join(runs['all'][index:index+count])
-            debug_print(f'\t{sign2}  Tamanhos iguais consecutivos [{content}]')
+            content = ', '.join(get_run_blocks(runs, index, index+count))
+            if debug: debug_print(f'\t{sign2}  Tamanhos iguais consecutivos [{content}]')
             return f"Tamanhos iguais consecutivos [{content}]"
         else:
             block = bit * run_sizes[index]
-            debug_print(f'\t{sign2}  Blocos de [{block}] consecutivos')
+            if debug: debug_print(f'\t{sign2}  Blocos de [{block}] consecutivos')
             return f"{count} blocos consecutivos com o mesmo tamanho [{block}] [{' - '.join([block]*count)}]"
 
     for bit_type in ['all', 'zeros', 'ones']:
         run_sizes = ordered_run_sizes[bit_type]
         bit = '0' if bit_type == 'zeros' else '1' if bit_type == 'ones' else 'all'
 
-        i = 0
-        while i < len(run_sizes):
-            count = 1
-            while i + count < len(run_sizes) and run_sizes[i] == run_sizes[i + count]:
-                count += 1
-
+        for i, count, size in _same_size_spans(run_sizes):
             if count >= 5:
                 comply = False
-                relevants[f"{bit_type}{i}"] = warning_result(bit, run_sizes, i, count, 1)
+                relevants.append(warning_result(bit, run_sizes, i, count, 1))
             elif count in [3, 4]:
-                if run_sizes[i] > 2:
+                if size > 2:
                     comply = False
-                    relevants[f"{bit_type}{i}"] = warning_result(bit, run_sizes, i, count, 1)
+                    relevants.append(warning_result(bit, run_sizes, i, count, 1))
                 else:
-                    warnings[f"{bit_type}{i}"] = warning_result(bit, run_sizes, i, count, 0)
+                    warnings.append(warning_result(bit, run_sizes, i, count, 0))
             elif count == 2:
-                if run_sizes[i] >= 4:
+                if size >= 4:
                     comply = False
-                    relevants[f"{bit_type}{i}"] = warning_result(bit, run_sizes, i, count, 1)
-
-            i += count
+                    relevants.append(warning_result(bit, run_sizes, i, count, 1))
     
     if not(warnings or relevants):
         debug_print('\t✔️  Nenhum padrão encontrado')
 
-    return [comply, list(relevants.values()), list(warnings.values())]
+    return [comply, relevants, warnings]
+#
+def _same_size_spans(sizes: list[int]) -> list[tuple[int, int, int]]:
+    """
+    Encontra os trechos máximos de blocos consecutivos com o mesmo tamanho (2 ou mais blocos).
+
+    :Note:
+    - Apenas percorre os tamanhos; as regras e as mensagens ficam em `verify_successively_same_size`,
+      que só trabalha sobre os (poucos) trechos encontrados.
+    - As fronteiras entre trechos são os índices onde o tamanho difere do anterior.
+
+    :param sizes: Tamanhos dos blocos, pela ordem da sequência.
+    :type sizes: list[int]
+    :return: Lista de (posição inicial, número de blocos, tamanho) para cada trecho.
+    :rtype: list[tuple[int, int, int]]
+
+    :Example:
+    >>> _same_size_spans([1, 1, 1, 5, 1, 1, 1, 1, 1, 3])
+    [(0, 3, 1), (4, 5, 1)]
+    """
+    if not sizes:
+        return []
+
+    # posições onde o tamanho muda em relação ao bloco anterior, encontradas em C por map/compress
+    changes = compress(range(1, len(sizes)), map(ne, sizes, sizes[1:]))
+    boundaries = [0, *changes, len(sizes)]
+
+    return [(start, end - start, sizes[start])
+            for start, end in zip(boundaries, boundaries[1:])
+            if end - start >= 2]
 #
 def verify_mirror_pattern(runs: dict) -> tuple[bool, list[str], list[str]]:
     """
@@ -782,8 +885,10 @@ def verify_mirror_pattern(runs: dict) -> tuple[bool, list[str], list[str]]:
     :Note:
     Só avalia padrões com número ímpar de blocos (3, 5, 7, ...) e exige pelo menos simetria visual
     ao redor de um bloco central.
+    O maior espelho de cada centro é obtido numa única passagem por `_mirror_radii` (Manacher); cada centro
+    gera no máximo um aviso (5 blocos) e uma mensagem relevante (o maior espelho, com 7 ou mais blocos).
 
-    :param runs: dicionário contendo os blocos da sequência já separados por tipo.
+    :param runs: dicionário com os tamanhos dos blocos ('lengths') e o bit do primeiro bloco ('first_bit').
     :type runs: dict
 
     :return:
@@ -793,7 +898,7 @@ def verify_mirror_pattern(runs: dict) -> tuple[bool, list[str], list[str]]:
     :rtype: tuple[bool, list[str], list[str]]
 
     :Example:
-    >>> runs = {'all': ['0', '1', '0', '11111', '0', '1', '0', '1', '0', '111']}
+    >>> runs = {'lengths': [1, 1, 1, 5, 1, 1, 1, 1, 1, 3], 'first_bit': 0}
     >>> comply4, relevants4, warnings4 = verify_mirror_pattern(runs)
     >>> comply4
     False
@@ -804,35 +909,68 @@ def verify_mirror_pattern(runs: dict) -> tuple[bool, list[str], list[str]]:
      'Talvez um padrão espelhado? [0 1 0 1 0]']
     """
     debug_print('  🛠️  Verificando padrões em espelho')
-    len_runs_sizes = len(runs['all'])
+    lengths = runs['lengths']
+    len_runs_sizes = len(lengths)
     max_len_groups_run = int(len_runs_sizes/2)
     comply = True
-    warnings = {}
-    relevants = {}
+    warnings = []
+    relevants = []
 
-    for size_groups_run in range(3, max_len_groups_run +1):
+    # Raio do maior espelho centrado em cada bloco; um grupo de 2k-1 blocos é espelhado se o raio for >= k-1
+    for center_scan, radius in enumerate(_mirror_radii(lengths)):
+        size_groups_run = min(radius +1, max_len_groups_run)
+        if size_groups_run < 3:
+            continue
 
-        for center_scan in range(size_groups_run -1, len_runs_sizes - size_groups_run +1):
+        blocks = get_run_blocks(runs, center_scan - 2, center_scan + 3)
+        if debug: debug_print(f'\t🧭 Padrão espelhado fraco {blocks}')
+        warnings.append(f"Talvez um padrão espelhado? [{' '.join(blocks)}]")
 
+        if size_groups_run > 3:
             start = center_scan - size_groups_run +1
             end = center_scan + size_groups_run -1
-
-            group = ' '.join(runs['all'][start : center_scan+1])
-            next_mirror_group = ' '.join(reversed(runs['all'][center_scan: end+1]))
-
-            if group == next_mirror_group:
-                if size_groups_run == 3:
-                    debug_print(f'\t🧭 Padrão espelhado fraco {runs['all'][start : end+1]}')
-                    warnings[center_scan] = (f"Talvez um padrão espelhado? [{' '.join(runs['all'][start : end+1])}]")
-                else:
-                    debug_print(f'\t⚠️  Padrão espelhado forte {runs['all'][start : end+1]}')
-                    comply = False
-                    relevants[center_scan] = (f"Padrão espelhado [{' '.join(runs['all'][start : end+1])}]")
+            blocks = get_run_blocks(runs, start, end+1)
+            if debug: debug_print(f'\t⚠️  Padrão espelhado forte {blocks}')
+            comply = False
+            relevants.append(f"Padrão espelhado [{' '.join(blocks)}]")
 
     if not(warnings or relevants):
         debug_print('\t✔️  Nenhum padrão encontrado')
                 
-    return [comply, list(relevants.values()), list(warnings.values())]
+    return [comply, relevants, warnings]
+#
+def _mirror_radii(tokens: list) -> list[int]:
+    """
+    Calcula, para cada posição, o raio do maior padrão espelhado (palíndromo ímpar) centrado nela,
+    usando o algoritmo de Manacher em tempo linear.
+
+    :Note:
+    - O raio é o número de blocos de cada lado que coincidem com o lado oposto: raio 2 equivale a 5 blocos.
+    - Reutiliza os raios de espelhos já encontrados, por isso cada comparação extra alarga o espelho mais à direita.
+
+    :param tokens: Lista de elementos comparáveis (ex: tamanhos dos blocos).
+    :type tokens: list
+    :return: Lista com o raio de cada posição.
+    :rtype: list[int]
+
+    :Example:
+    >>> _mirror_radii([1, 1, 1, 5, 1, 1, 1, 1, 1, 3])
+    [0, 1, 0, 3, 0, 1, 2, 1, 0, 0]
+    """
+    len_tokens = len(tokens)
+    radii = [0] * len_tokens
+    left, right = 0, -1
+
+    for center in range(len_tokens):
+        radius = 0 if center > right else min(radii[left + right - center], right - center)
+        while (center - radius > 0 and center + radius +1 < len_tokens
+               and tokens[center - radius -1] == tokens[center + radius +1]):
+            radius += 1
+        radii[center] = radius
+        if center + radius > right:
+            left, right = center - radius, center + radius
+
+    return radii
 #
 def verify_match_between_zeros_and_ones(ordered_run_sizes: dict) -> tuple[bool, list[str], list[str]]:
     """
@@ -882,15 +1020,20 @@ def verify_match_between_zeros_and_ones(ordered_run_sizes: dict) -> tuple[bool,
     len_zeros = len(ordered_run_sizes['zeros'])
     len_ones = len(ordered_run_sizes['ones'])
     count_groups = {'exact': {}, 'relative': {}}
-
-    def is_subpattern_of_existing(group_0_str, count_groups, relation) -> dict:
-        for group_str in count_groups[relation].keys():
-            if group_0_str in group_str:
-                if group_0_str == group_str:
-                    count_groups[relation][group_str] += 1
-                break
+    # chaves de cada relação unidas por '\n', pela ordem de inserção, para procurar em todas de uma vez
+    keys_blob = {'exact': '', 'relative': ''}
+
+    def is_subpattern_of_existing(group_0_str, count_groups, relation, times=1) -> dict:
+        blob = keys_blob[relation]
+        position = blob.find(group_0_str)
+        if position == -1:
+            count_groups[relation][group_0_str] = times
+            keys_blob[relation] = f'{blob}\n{group_0_str}' if blob else group_0_str
         else:
-            count_groups[relation][group_0_str] = 1
+            # a primeira ocorrência está na primeira chave que o contém; só conta se for a chave inteira
+            end = position + len(group_0_str)
+            if (position == 0 or blob[position -1] == '\n') and (end == len(blob) or blob[end] == '\n'):
+                count_groups[relation][group_0_str] += times
         return count_groups
 
     def warnings_message(debug_label, target_list, which_message, relation, group):
@@ -901,34 +1044,27 @@ def verify_match_between_zeros_and_ones(ordered_run_sizes: dict) -> tuple[bool,
 
         if which_message == 1:
             target_list.append(f"Blocos de tamanhos {relat}[{group}] aparecem {qtt} vezes em blocos de '1' e '0'")
-            debug_print(f"{debug_label}Blocos de tamanhos {relat}[{group}] em excesso em blocos de '1' e '0'")
+            if debug: debug_print(f"{debug_label}Blocos de tamanhos {relat}[{group}] em excesso em blocos de '1' e '0'")
         elif which_message == 2:
             target_list.append(f"Blocos {relat}de 0 e 1, totalmente iguais")
-            debug_print(f"{debug_label}Blocos {relat}de 0 e 1, totalmente iguais")
+            if debug: debug_print(f"{debug_label}Blocos {relat}de 0 e 1, totalmente iguais")
         elif which_message == 3:
             target_list.append(f"Blocos {relat}de 0 e 1, com padrões alternados repetivivos")
-            debug_print(f"{debug_label}Blocos {relat}de 0 e 1, com padrões alternados repetivivos")
+            if debug: debug_print(f"{debug_label}Blocos {relat}de 0 e 1, com padrões alternados repetivivos")
 
         return target_list
 
 
     for process_type in [ordered_run_sizes, relative_sizes]:
         relation = 'exact' if process_type == ordered_run_sizes else 'relative'
-
-        for size_groups_run in range(len_zeros, 2, -1):
-            groups_to_scan_0 = len_zeros - size_groups_run +1
-            groups_to_scan_1 = len_ones - size_groups_run +1
-
-            for index_zero in range(groups_to_scan_0):
-                group_0 = process_type['zeros'][index_zero : index_zero + size_groups_run]
-                group_0_str = '|'.join(str(run) for run in group_0)
-
-                for index_one in range(groups_to_scan_1):
-                    group_1 = process_type['ones'][index_one : index_one + size_groups_run]
-                    group_1_str = '|'.join(str(run) for run in group_1)
-                    
-                    if group_0_str == group_1_str:
-                        count_groups = is_subpattern_of_existing(group_0_str, count_groups, relation)
+        tokens_zeros = process_type['zeros']
+        tokens_ones = process_type['ones']
+        tokens_zeros_str = list(map(str, tokens_zeros))
+
+        # só os emparelhamentos máximos contam: um menor, contido num maior, já estaria contido numa chave
+        for size_groups_run, index_zero, times in _maximal_common_windows(tokens_zeros, tokens_ones, 3):
+            group_0_str = '|'.join(tokens_zeros_str[index_zero : index_zero + size_groups_run])
+            count_groups = is_subpattern_of_existing(group_0_str, count_groups, relation, times)
                         
         for group, qtt in count_groups[relation].items():
             sizes = group.split('|')
@@ -968,6 +1104,43 @@ def verify_match_between_zeros_and_ones(ordered_run_sizes: dict) -> tuple[bool,
         comply = False
     return [comply, relevants, warnings]
 #
+def _maximal_common_windows(tokens_zeros: list, tokens_ones: list, min_size: int) -> list[tuple[int, int, int]]:
+    """
+    Encontra as janelas máximas de elementos consecutivos iguais entre duas listas.
+
+    :Note:
+    - Percorre cada diagonal (deslocamento fixo entre as posições das duas listas) uma única vez.
+    - Uma janela é máxima quando não pode ser alargada para a esquerda nem para a direita na mesma diagonal.
+    - Janelas máximas com o mesmo tamanho e a mesma posição em `tokens_zeros` são agrupadas e contadas.
+
+    :param tokens_zeros: Lista de tamanhos (ou rótulos) dos blocos de zeros.
+    :type tokens_zeros: list
+    :param tokens_ones: Lista de tamanhos (ou rótulos) dos blocos de uns.
+    :type tokens_ones: list
+    :param min_size: Tamanho mínimo das janelas a devolver.
+    :type min_size: int
+    :return: Lista de (tamanho, posição em `tokens_zeros`, quantidade), do maior tamanho para o menor e,
+             em cada tamanho, pela posição.
+    :rtype: list[tuple[int, int, int]]
+
+    :Example:
+    >>> _maximal_common_windows([1, 2, 3, 4, 1, 2, 3], [9, 1, 2, 3, 1, 2, 3], 3)
+    [(3, 0, 2), (3, 4, 2)]
+    """
+    len_zeros = len(tokens_zeros)
+    counts = Counter()
+
+    for offset in range(-len_zeros + 1, len(tokens_ones)):
+        position = max(0, -offset)
+        for equal, group in groupby(map(eq, tokens_zeros[position:], tokens_ones[position + offset:])):
+            size = sum(1 for _ in group)
+            if equal and size >= min_size:
+                counts[(size, position)] += 1
+            position += size
+
+    return [(size, index_zero, times) for (size, index_zero), times
+            in sorted(counts.items(), key=lambda item: (-item[0][0], item[0][1]))]
+#
 def get_thresholds_and_labels(ordered_run_sizes: dict) -> dict:
     """
     Classifica os tamanhos dos blocos (runs) em categorias relativas, com base na margem entre
@@ -1000,10 +1173,9 @@ def get_thresholds_and_labels(ordered_run_sizes: dict) -> dict:
      'ones': ['large', 'mid', 'mid', 'large', 'mid']}
     """
     debug_print(f'\t🎲 Calculando tamanhos relativos dos blocos')
-    sorted_all = sorted(ordered_run_sizes['all'])
     relative_size = {'zeros': [], 'ones': []}
-    min_val = sorted_all[0]
-    max_val = sorted_all[-1]
+    min_val = min(ordered_run_sizes['all'])
+    max_val = max(ordered_run_sizes['all'])
     margin = max_val - min_val
 
     if margin == 0:
@@ -1041,19 +1213,74 @@ def get_thresholds_and_labels(ordered_run_sizes: dict) -> dict:
         labels = ['very_small', 'small', 'mid', 'large', 'huge']
         debug_print(f"\t📐 Usando quintos → limiares: {thresholds} → ['very_small', 'small', 'mid', 'large', 'huge']")    
 
-    def classify(run):
-        for i, threshold in enumerate(thresholds):
-            if run <= threshold:
-                return labels[i]
-        return labels[-1]
+    # bisect_left devolve o índice do primeiro limiar >= tamanho, que é o índice do rótulo
+    label_of = {run: labels[bisect_left(thresholds, run)] for run in set(ordered_run_sizes['all'])}
 
     for bit_type in ['zeros', 'ones']:
-        for run in ordered_run_sizes[bit_type]:
-            relative_size[bit_type].append(classify(run))
+        relative_size[bit_type] = [label_of[run] for run in ordered_run_sizes[bit_type]]
 
     return relative_size
 
 
+#BATCH
+def analyse_sequence(sequence: str) -> dict:
+    """
+    Analisa uma sequência binária pelos três pressupostos de Golomb, sem interação com o usuário.
+
+    :Note:
+    - A sequência já deve ter sido validada como binária (ver `verify_sequence`).
+    - Cria o seu próprio dicionário `postulates`, por isso pode ser chamada de forma independente para cada sequência.
+
+    :param sequence: Sequência binária (apenas 0s e 1s)
+    :type sequence: str
+    :return: Dicionário `postulates` com 'comply', 'relevants' e 'warnings' de cada pressuposto.
+    :rtype: dict
+
+    :Example:
+    >>> analyse_sequence('0100111100100101100')[2]['comply']
+    False
+    """
+    postulates = {
+        1: {'comply': True, 'relevants': [], 'warnings': []},
+        2: {'comply': True, 'relevants': [], 'warnings': []},
+        3: {'comply': True, 'relevants': [], 'warnings': []}
+    }
+    num_bits, runs, run_frequencies, ordered_run_sizes = gettin_sequence_basics(sequence)
+
+    postulates, _, _, _ = check_first_postulate(num_bits, postulates)
+    postulates = check_second_postulate(run_frequencies, postulates)
+    postulates = check_third_postulate(run_frequencies, ordered_run_sizes, runs, postulates)
+    return postulates
+#
+def analyse_many(sequences: list[str], workers: int | None = None) -> list[dict]:
+    """
+    Analisa várias sequências binárias em paralelo, uma por processo, e devolve os resultados pela mesma ordem.
+
+    :Note:
+    - Cada sequência é independente, por isso a análise é distribuída por um `ProcessPoolExecutor`
+      (processos e não threads, já que as verificações são código Python puro).
+    - Em Windows, deve ser chamada a partir de código protegido por `if __name__ == '__main__':`.
+
+    :param sequences: Lista de sequências binárias já validadas.
+    :type sequences: list[str]
+    :param workers: Número de processos a usar; None usa o número de CPUs.
+    :type workers: int | None
+    :return: Lista com o dicionário `postulates` de cada sequência (ver `analyse_sequence`).
+    :rtype: list[dict]
+
+    :Example:
+    >>> results = analyse_many(['0100111100100101100', '0001011100'])
+    >>> [result[1]['comply'] for result in results]
+    [True, True]
+    """
+    debug_print(f'\n🧮 Analisando {len(sequences)} sequências em paralelo')
+    workers = workers or cpu_count() or 1
+    # Grupos de várias sequências por tarefa, para não pagar a comunicação entre processos por cada uma
+    chunksize = max(1, len(sequences) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(analyse_sequence, sequences, chunksize=chunksize))
+
+
 #INPUT & OUTPUT
 def verify_sequence(sequence: str) -> bool:
     """
@@ -1063,6 +1290,7 @@ def verify_sequence(sequence: str) -> bool:
     :Note:
     - Espaços, letras ou outros símbolos além de '0' e '1' tornam a sequência inválida.
     - A função espera que o argumento seja do tipo string.
+    - Uma sequência vazia é inválida.
 
     :param sequence: Sequência a ser verificada
     :type sequence: str
@@ -1078,19 +1306,67 @@ def verify_sequence(sequence: str) -> bool:
 
     >>> verify_sequence("ola mundo")
     False
+
+    >>> verify_sequence("")
+    False
     """
     debug_print('\n🔍 Vericando se sequencia é binária')
-    try:
-        int(sequence) #ValueError
-        for bit in sequence:
-            if bit not in '01': #ValueError
-                raise ValueError
+    if not sequence:
+        debug_print('❌ Sequência vazia')
+        return False
+
+    # remove todos os '0' e '1': uma sequência binária não deixa nada para trás
+    if not sequence.translate(_DELETE_BINARY_DIGITS):
         debug_print('✅ Sequencia válida')
         return True
-                    
-    except ValueError:
-        debug_print('❌ Sequência inválido')
-        return False
+
+    debug_print('❌ Sequência inválido')
+    return False
+#
+@lru_cache(maxsize=None)
+def _piped_answers():
+    """
+    Lê de uma só vez todas as respostas, quando a entrada padrão não é um terminal (ex: `python pressupostos_golomb.py < casos.txt`).
+
+    :Note:
+    - Só é chamada na primeira pergunta, e o resultado fica guardado; importar o módulo nunca lê da entrada padrão.
+
+    :return: Iterador sobre as linhas lidas, ou None se a entrada for interativa.
+    :rtype: Iterator[str] | None
+    """
+    if sys.stdin.isatty():
+        return None
+    return iter(sys.stdin.read().splitlines())
+#
+def _ask(prompt: str = '') -> str:
+    """
+    Faz uma pergunta ao usuário, como `input`, mas sem uma leitura da entrada padrão por resposta quando esta vem de um ficheiro ou pipe.
+
+    :Note:
+    - Num terminal, delega em `input`, mantendo o comportamento interativo.
+    - Caso contrário, escreve o texto da pergunta e devolve a próxima linha já lida por `_piped_answers`.
+
+    :param prompt: Texto exibido antes da resposta.
+    :type prompt: str
+    :return: Resposta do usuário, sem a quebra de linha final.
+    :rtype: str
+
+    :raise EOFError: Se já não houver respostas para ler, tal como `input`.
+
+    :Example:
+    >>> _ask('Deseja recomeçar? (S/N)')
+    Deseja recomeçar? (S/N)S
+    'S'
+    """
+    answers = _piped_answers()
+    if answers is None:
+        return input(prompt)
+
+    sys.stdout.write(prompt)
+    answer = next(answers, None)
+    if answer is None:
+        raise EOFError
+    return answer
 #
 def create_random_sequence(length: int) -> str:
     """
@@ -1098,6 +1374,7 @@ def create_random_sequence(length: int) -> str:
 
     :Note:
     - Cada bit é gerado de forma independente, com valores 0 ou 1 escolhidos aleatoriamente.
+    - Os bits são lidos de uma só vez do gerador do sistema operativo (`os.urandom`) e convertidos em texto.
     - Assume que o parâmetro `length` já foi validado previamente.
 
     :param length: Número total de bits a serem gerados na sequência.
@@ -1112,13 +1389,13 @@ def create_random_sequence(length: int) -> str:
     '01100001000001111100100'
     """
     debug_print('\n🔄️ Gerando sequência aleatoria')
-    sequence = ''
-    for bit in range(length):
-        sequence += str(randint(0,1))
+    num_bytes = (length + 7) // 8
+    random_bits = int.from_bytes(urandom(num_bytes), 'big')
+    sequence = format(random_bits, f'0{num_bytes * 8}b')[:length]
     debug_print('📁 Sequencia completa')
     return sequence
 #
-def create_postulates_sequence(postulate_to_match: list, postulates: dict, length: int) -> str:
+def create_postulates_sequence(postulates_mask: int, postulates: dict, length: int) -> str:
     """
     Cria uma sequência binária que cumpre os pressupostos de Golomb selecionados.
 
@@ -1126,9 +1403,10 @@ def create_postulates_sequence(postulate_to_match: list, postulates: dict, lengt
     - Tenta gerar até 5000 sequências aleatórias até encontrar uma que atenda aos pressupostos marcados.
     - Se nenhuma sequência válida for encontrada dentro do limite, uma exceção é lançada.
     - Cada tentativa envolve gerar uma sequência aleatória, extrair suas características e aplicar os testes de conformidade.
+    - O pressuposto 1 é testado primeiro apenas com a contagem de bits; os blocos só são extraídos se for necessário testar os pressupostos 2 ou 3.
 
-    :param postulate_to_match: Lista com 3 valores representando os pressupostos a cumprir ('' ou 'x').
-    :type postulate_to_match: list
+    :param postulates_mask: Pressupostos a cumprir, um bit por pressuposto (1 → pressuposto 1, 2 → pressuposto 2, 4 → pressuposto 3).
+    :type postulates_mask: int
     :param postulates: Dicionário contendo os estados de conformidade de cada pressuposto.
     :type postulates: dict
     :param length: Comprimento da sequência binária a ser gerada.
@@ -1140,37 +1418,36 @@ def create_postulates_sequence(postulate_to_match: list, postulates: dict, lengt
     :raise Exception: Se após 5000 tentativas nenhuma sequência cumprir todos os pressupostos indicados.
 
     :Example:
-    >>> postulates_to_match = ['x', '', 'x']
+    >>> postulates_mask = 0b101
     >>> length = 14
     >>> postulates = {
     ...     1: {'comply': True, 'relevants': [], 'warnings': []},
     ...     2: {'comply': True, 'relevants': [], 'warnings': []},
     ...     3: {'comply': True, 'relevants': [], 'warnings': []}
     ... }
-    >>> create_postulates_sequence(postulates_to_match, postulates, length)
+    >>> create_postulates_sequence(postulates_mask, postulates, length)
     '11100000011001'
     """
-    p1, p2, p3 = postulate_to_match
     debug_print('\n🔄️ Gerando sequencia que cumpra os pressupostos selecionados')
     attemps = 0
     max_attemps = 5000
+    min_percentage = get_min_percentage(length)
     while attemps <= max_attemps:
         attemps += 1
         random_seq = create_random_sequence(length)
 
-        #Analise sequence
-        num_bits, runs, run_frequencies, ordered_run_sizes = gettin_sequence_basics(random_seq)
-
-        #Analise sequence by golomb
-        if p1 != '':
-            postulates, _, _, _ = check_first_postulate(num_bits, postulates)
+        #Analise sequence by golomb, only counting bits until postulate 1 passes
+        if postulates_mask & 1:
+            postulates, _, _, _ = check_first_postulate(count_bits(random_seq), postulates, min_percentage)
             if not postulates[1]['comply']:
                 continue
-        if p2 != '':
+        if postulates_mask & 0b110:
+            _, runs, run_frequencies, ordered_run_sizes = gettin_sequence_basics(random_seq)
+        if postulates_mask & 2:
             postulates = check_second_postulate(run_frequencies, postulates)
             if not (postulates[2]['comply'] or postulates[2]['relevants']):
                 continue
-        if p3 != '':
+        if postulates_mask & 4:
             postulates = check_third_postulate(run_frequencies, ordered_run_sizes, runs, postulates)
             if not (postulates[3]['comply'] or postulates[3]['relevants']):
                 continue
@@ -1182,6 +1459,37 @@ def create_postulates_sequence(postulate_to_match: list, postulates: dict, lengt
     debug_print('\n📦 Sequencia completa')
     return random_seq
 #
+@lru_cache(maxsize=128)
+def create_cached_postulates_sequence(postulates_mask: int, length: int) -> str:
+    """
+    Versão memorizada de `create_postulates_sequence`, usada quando a variável de ambiente BITSTREAM_CACHE=1.
+
+    :Note:
+    - A sequência gerada para cada combinação de pressupostos e comprimento é guardada e devolvida nos pedidos seguintes,
+      por isso deixa de ser aleatória entre pedidos iguais.
+    - Usa o seu próprio dicionário `postulates`, já que o resultado não pode depender do estado de quem chama.
+    - Se nenhuma sequência for encontrada, a exceção de `create_postulates_sequence` propaga-se e nada é guardado.
+
+    :param postulates_mask: Pressupostos a cumprir, um bit por pressuposto (ver `create_postulates_sequence`).
+    :type postulates_mask: int
+    :param length: Comprimento da sequência binária a ser gerada.
+    :type length: int
+
+    :return: Sequência binária que cumpre os pressupostos especificados.
+    :rtype: str
+
+    :Example:
+    >>> first = create_cached_postulates_sequence(0b101, 14)
+    >>> create_cached_postulates_sequence(0b101, 14) == first
+    True
+    """
+    postulates = {
+        1: {'comply': True, 'relevants': [], 'warnings': []},
+        2: {'comply': True, 'relevants': [], 'warnings': []},
+        3: {'comply': True, 'relevants': [], 'warnings': []}
+    }
+    return create_postulates_sequence(postulates_mask, postulates, length)
+#
 def print_final_output(sequence, num_bits, percent_zeros, percent_ones, min_percentage, runs, run_frequencies, 
                        ordered_run_sizes, postulates) -> None:
     """
@@ -1207,7 +1515,7 @@ def print_final_output(sequence, num_bits, percent_zeros, percent_ones, min_perc
     :param min_percentage: Percentagem mínima exigida de 0's ou 1's para cumprir o Pressuposto 1.
     :type min_percentage: float
 
-    :param runs: Dicionário com listas de blocos da sequência (todos, apenas 0's, apenas 1's).
+    :param runs: Dicionário com os tamanhos dos blocos da sequência ('lengths') e o bit do primeiro bloco ('first_bit').
     :type runs: dict
 
     :param run_frequencies: Frequência de blocos por tamanho. Ex: {1: 5, 2: 4, 3: 1}.
@@ -1232,9 +1540,7 @@ def print_final_output(sequence, num_bits, percent_zeros, percent_ones, min_perc
     ...     percent_zeros=52.63,
     ...     percent_ones=47.37,
     ...     min_percentage=44.50,
-    ...     runs={'all': ['0', '1', '00', '1111', '00', '1', '00', '1', '0', '11', '00'],
-    ...           'zeros': ['0', '00', '00', '00', '0', '00'],
-    ...           'ones': ['1', '1111', '1', '1', '11']},
+    ...     runs={'lengths': [1, 1, 2, 4, 2, 1, 2, 1, 1, 2, 2], 'first_bit': 0},
     ...     run_frequencies={'all': {1: 5, 2: 5, 4: 1}},
     ...     ordered_run_sizes={'zeros': [1, 2, 2, 2, 1, 2], 'ones': [1, 4, 1, 1, 2]},
     ...     postulates={
@@ -1243,7 +1549,7 @@ def print_final_output(sequence, num_bits, percent_zeros, percent_ones, min_perc
     ...         3: {'comply': False, 'relevants': ['Bloco [00 1] repete-se sucessivamente'], 'warnings': ['Tamanhos de blocos [1, 1, 2] repete-se 2 vezes.']}
     ...     }
     ... )"""
-    # Exibe os resultados da análise em blocos visuais formatados.
+    # Exibe os resultados da análise em blocos visuais formatados, uma escrita por secção.
     debug_print('\n📝 Exibindo resultado')
     separator = '-' * 50
     len_sep = 50
@@ -1253,102 +1559,75 @@ def print_final_output(sequence, num_bits, percent_zeros, percent_ones, min_perc
     red = Fore.RED
     green = Fore.GREEN
     yellow = Fore.YELLOW
-
-    print("\n\n\n" + separator)
-    print(bright_blue + "📊 RESULTADO FINAL DA ANÁLISE".center(len_sep))
-    print(separator)
-    print(f"\tSequencia:      \t{sequence}")
-    print(f"\tTotal de bits:  \t{num_bits['all']}")
-    print(f"\tNumero de 0's:  \t{num_bits['zeros']}")
-    print(f"\tNumero de 1's:  \t{num_bits['ones']}")
-
-
-    print("\n\n\n" + separator)
-    print(bright_blue + "☯️  PRESSUPOSTO 1 - Proporção de bits".center(len_sep))
-    print(separator)
-    print("   - percentagem de 0's e 1's tem de ser o mais próximo possível de 50%.")
-    print(f"\n\tPercentagem de 0's      \t{percent_zeros:.2f}%")
-    print(f"\tPercentagem de 1's      \t{percent_ones:.2f}%")
-    print(f"\tErro mínimo permitido   \t{min_percentage:.2f}%")
-    if postulates[1]['comply']:
-        p1 = f'✅ {green}{postulates[1]['comply']}'
-    else:
-        p1 = f'❌ {red}{postulates[1]['comply']}'
-    print(brigth + f"\nCUMPRE PRESSUPOSTO 1? {p1}")
-    print(dim + "Nota: Erro mínimo permitido: minimo de percentagem de 0's ou 1's para que o pressuposto seja verdadeiro.\n" +
-          "Varia entre 40% a 49%, dependendo do comprimento da sequencia. Calculado em get_min_percentage()")
-
-
-    print("\n\n\n" + separator)
-    print(bright_blue + "🔗 PRESSUPOSTO 2 - Comprimento de Runs".center(len_sep))
-    print(separator)
-    print("   - blocos menores têm de ser bem mais frequentes que blocos maiores")
-    print(f"\n\tBlocos           \t{' '.join(runs['all'])}")
-    print(f"\tTamanho de blocos  \t{list(run_frequencies['all'].items())}")
-    if postulates[2]['comply']:
-        p2 = f'✅ {green}{postulates[2]['comply']}'
-    else:
-        p2 = f'❌ {red}{postulates[2]['comply']}'
-    print(brigth + f"\nCUMPRE PRESSUPOSTO 2? {p2}")
-    print(dim + "Nota: 'Tamanho de blocos: quantidade de vezes que blocos de tamanho 1, 2, 3, 4... aparecem na sequencia'")
-
-
-    print("\n\n\n" + separator)
-    print(bright_blue + "🧩 PRESSUPOSTO 3 - Autocorreção".center(len_sep))
-    print(separator)
-    print("   - sequencia não deve apresentar padrões estruturais")
-    print(f"\n\tBlocos          \t{' '.join(runs['all'])}")
-    print(f"\tBlocos de 0's   \t[{' '.join(runs['zeros'])}]")
-    print(f"\tTamanho Blc 0's \t{ordered_run_sizes['zeros']}")
-    print(f"\tBlocos de 1's   \t[{' '.join(runs['ones'])}]")
-    print(f"\tTamanho Blc 1's \t{ordered_run_sizes['ones']}")    
-    if postulates[3]['comply']:
-        p3 = f'✅ {green}{postulates[3]['comply']}'
-    else:
-        p3 = f'❌ {red}{postulates[3]['comply']}'
-    print(brigth + f"\nCUMPRE PRESSUPOSTO 3? {p3}")
-    
-
-    print("\n\n\n" + separator)
-    print(bright_blue + "⚖️  ANÁLISE FINAL DOS PRESSUPOSTOS DE GOLOMB".center(len_sep))
-    print(separator)
-#
-    if not postulates[1]['comply']:
-        print(f"\n{red}❌ Problemas RELEVANTES encontrados no PRESSUPOSTO 1")
-        print(f"{yellow}  ⚠️  Relevants:")
-        for relevant in postulates[1]["relevants"]:
-            print('\t- ' + relevant)
-    else:
-        print(f"\n{green}📌 PRESSUPOSTO 1 - Proporção de bits: {p1}")
-        print('  🎉 Nenhum problema encontrado')
-#
-    if not postulates[2]['comply']:
-        print(f"\n{red}❌ Problemas RELEVANTES encontrados no PRESSUPOSTO 2")
-        print(f"{yellow}  ⚠️  Relevants:")
-        for relevant in postulates[2]["relevants"]:
-            print('\t- ' + relevant)
-    else:
-        print(f"\n{green}📌 PRESSUPOSTO 2 - Comprimento de Runs: {p2}")
-    if postulates[2]['warnings']:
-        print(f"{yellow}  🔍 Warnings:")
-        for warning in postulates[2]["warnings"]:
-            print('\t- ' + warning)
-    elif postulates[2]['comply']:
-        print('  🎉 Nenhum problema encontrado')
-#
-    if not postulates[3]['comply']:
-        print(f"\n{red}❌ Problemas RELEVANTES encontrados no PRESSUPOSTO 3")
-        print(f"{yellow}  ⚠️  Relevants:")
-        for relevant in postulates[3]["relevants"]:
-            print('\t- ' + relevant)
-    else:
-        print(f"\n{green}📌 PRESSUPOSTO 3 - Autocorreção: {p3}")
-    if postulates[3]['warnings']:
-        print(f"{yellow}  🔍 Warnings:")
-        for warning in postulates[3]["warnings"]:
-            print('\t- ' + warning)
-    elif postulates[3]['comply']:
-        print('  🎉 Nenhum problema encontrado')
+    reset = Style.RESET_ALL
+
+    def write_section(title: str, lines: list[str]) -> None:
+        # cada linha colorida termina com reset, já que o autoreset do colorama só atua no fim de cada escrita
+        header = ["\n\n\n" + separator, bright_blue + title.center(len_sep) + reset, separator]
+        sys.stdout.write('\n'.join(header + lines) + '\n')
+
+    def comply_label(postulate: int) -> str:
+        if postulates[postulate]['comply']:
+            return f'✅ {green}{postulates[postulate]['comply']}'
+        return f'❌ {red}{postulates[postulate]['comply']}'
+
+    def findings_lines(postulate: int, title: str, with_warnings: bool) -> list[str]:
+        lines = []
+        if not postulates[postulate]['comply']:
+            lines.append(f"\n{red}❌ Problemas RELEVANTES encontrados no PRESSUPOSTO {postulate}{reset}")
+            lines.append(f"{yellow}  ⚠️  Relevants:{reset}")
+            lines += ['\t- ' + relevant for relevant in postulates[postulate]["relevants"]]
+        else:
+            lines.append(f"\n{green}📌 PRESSUPOSTO {postulate} - {title}: {p_labels[postulate]}{reset}")
+        if with_warnings and postulates[postulate]['warnings']:
+            lines.append(f"{yellow}  🔍 Warnings:{reset}")
+            lines += ['\t- ' + warning for warning in postulates[postulate]["warnings"]]
+        elif postulates[postulate]['comply']:
+            lines.append('  🎉 Nenhum problema encontrado')
+        return lines
+
+    p_labels = {postulate: comply_label(postulate) for postulate in (1, 2, 3)}
+    blocks = ' '.join(get_run_blocks(runs))
+
+    write_section("📊 RESULTADO FINAL DA ANÁLISE", [
+        f"\tSequencia:      \t{sequence}",
+        f"\tTotal de bits:  \t{num_bits['all']}",
+        f"\tNumero de 0's:  \t{num_bits['zeros']}",
+        f"\tNumero de 1's:  \t{num_bits['ones']}",
+    ])
+
+    write_section("☯️  PRESSUPOSTO 1 - Proporção de bits", [
+        "   - percentagem de 0's e 1's tem de ser o mais próximo possível de 50%.",
+        f"\n\tPercentagem de 0's      \t{percent_zeros:.2f}%",
+        f"\tPercentagem de 1's      \t{percent_ones:.2f}%",
+        f"\tErro mínimo permitido   \t{min_percentage:.2f}%",
+        brigth + f"\nCUMPRE PRESSUPOSTO 1? {p_labels[1]}" + reset,
+        dim + "Nota: Erro mínimo permitido: minimo de percentagem de 0's ou 1's para que o pressuposto seja verdadeiro.\n" +
+        "Varia entre 40% a 49%, dependendo do comprimento da sequencia. Calculado em get_min_percentage()" + reset,
+    ])
+
+    write_section("🔗 PRESSUPOSTO 2 - Comprimento de Runs", [
+        "   - blocos menores têm de ser bem mais frequentes que blocos maiores",
+        f"\n\tBlocos           \t{blocks}",
+        f"\tTamanho de blocos  \t{list(run_frequencies['all'].items())}",
+        brigth + f"\nCUMPRE PRESSUPOSTO 2? {p_labels[2]}" + reset,
+        dim + "Nota: 'Tamanho de blocos: quantidade de vezes que blocos de tamanho 1, 2, 3, 4... aparecem na sequencia'" + reset,
+    ])
+
+    write_section("🧩 PRESSUPOSTO 3 - Autocorreção", [
+        "   - sequencia não deve apresentar padrões estruturais",
+        f"\n\tBlocos          \t{blocks}",
+        f"\tBlocos de 0's   \t[{' '.join('0' * size for size in ordered_run_sizes['zeros'])}]",
+        f"\tTamanho Blc 0's \t{ordered_run_sizes['zeros']}",
+        f"\tBlocos de 1's   \t[{' '.join('1' * size for size in ordered_run_sizes['ones'])}]",
+        f"\tTamanho Blc 1's \t{ordered_run_sizes['ones']}",
+        brigth + f"\nCUMPRE PRESSUPOSTO 3? {p_labels[3]}" + reset,
+    ])
+
+    write_section("⚖️  ANÁLISE FINAL DOS PRESSUPOSTOS DE GOLOMB",
+                  findings_lines(1, 'Proporção de bits', with_warnings=False)
+                  + findings_lines(2, 'Comprimento de Runs', with_warnings=True)
+                  + findings_lines(3, 'Autocorreção', with_warnings=True))
    
 
 #STARTING CHOICES
@@ -1382,7 +1661,7 @@ def beginning_text(separator: str) -> str:
     print(f'\t1. Analisar aleatoriedade de sequência.')
     print(f'\t2. Gerar uma sequência de bits.')
     print(f'\t3. Sair.')
-    choice_to_do = input('')
+    choice_to_do = _ask('')
     return choice_to_do
 
 def chose_analise_sequence(separator: str, postulates: dict) -> None:
@@ -1423,10 +1702,10 @@ def chose_analise_sequence(separator: str, postulates: dict) -> None:
     print(separator)
 
     while True:
-        sequence = input('   - Introduza a sua sequência de bits: ')
+        sequence = _ask('   - Introduza a sua sequência de bits: ')
         status = verify_sequence(sequence)
         if not status:
-            print(f'⚠️  {Fore.RED}Valor inválido: {Style.RESET_ALL}\"{sequence}\". Apenas bits. Ex: 100101101')
+            print(_ERR_PREFIX + sequence + '". Apenas bits. Ex: 100101101')
         else: break
 
     #Getting sequence basics
@@ -1446,7 +1725,7 @@ def chose_generate_sequence(separator: str, postulates: dict) -> None:
     Gera uma sequência de bits, podendo ser aleatória ou cumprir os pressupostos de Golomb.
 
     :Note:
-    - Sempre pergunta ao usuário o comprimento da sequência e valida se é um número inteiro.
+    - Sempre pergunta ao usuário o comprimento da sequência e valida se é um número inteiro positivo.
     - Em caso de geração com regras, permite escolher quais pressupostos deseja cumprir (1, 2 e/ou 3).
     - Usa funções auxiliares 'create_random_sequence()' ou 'create_postulates_sequence()' para gerar a sequência.
 
@@ -1488,18 +1767,20 @@ def chose_generate_sequence(separator: str, postulates: dict) -> None:
     print('Que tipo de sequencia deseja criar?')
     print('\t1. Sequencia gerada aleatoriamente.')
     print('\t2. Sequencia que cumpra os pressupostos')
-    choice_seq_type = input('')
+    choice_seq_type = _ask('')
     
     while True:
+        answer = _ask('\nQual o comprimento da sequência? ')
+        debug_print('\n🔍 Verificando se comprimento é inteiro')
         try:
-            lenght = input('\nQual o comprimento da sequência? ')
-            debug_print('\n🔍 Verificando se comprimento é inteiro')
-            lenght = int(lenght)
+            lenght = int(answer)
+        except ValueError:
+            lenght = 0
+        if lenght > 0:
             debug_print('✅ Comprimento válido')
             break
-        except ValueError:
-            debug_print('❌ Comprimento inválido')
-            print(f'⚠️  {Fore.RED}Valor inválido: {Style.RESET_ALL}\"{lenght}\". Apenas números')
+        debug_print('❌ Comprimento inválido')
+        print(_ERR_PREFIX + answer + '". Apenas números inteiros positivos')
 
     debug_print('\n🧐 Analisando o tipo de sequência a gerar')
 
@@ -1509,13 +1790,20 @@ def chose_generate_sequence(separator: str, postulates: dict) -> None:
         print('\nSelecione com um \'X\' os que deseja cumprir')
 
         postulates_to_match = []
-        postulates_to_match.append(input('\tPressuposto 1, equilibrio: '))
-        postulates_to_match.append(input('\tPressuposto 2, frequência: '))
-        postulates_to_match.append(input('\tPressuposto 3, padrões:    '))
-
-        postulate_sequence = create_postulates_sequence(postulates_to_match, postulates, lenght)
+        postulates_to_match.append(_ask('\tPressuposto 1, equilibrio: '))
+        postulates_to_match.append(_ask('\tPressuposto 2, frequência: '))
+        postulates_to_match.append(_ask('\tPressuposto 3, padrões:    '))
+        # qualquer resposta não vazia marca o pressuposto; bit 0 → pressuposto 1, bit 1 → 2, bit 2 → 3
+        postulates_mask = sum(1 << index for index, answer in enumerate(postulates_to_match) if answer != '')
+
+        if cache_sequences:
+            postulate_sequence = create_cached_postulates_sequence(postulates_mask, lenght)
+        else:
+            postulate_sequence = create_postulates_sequence(postulates_mask, postulates, lenght)
         debug_print('\n📝 Exibindo resultado')
-        print(f'\n{Fore.YELLOW}Sequência:', postulate_sequence)
+        # uma só escrita (sequências longas não são copiadas para a formatação de print); o reset delimita a cor ao rótulo
+        sys.stdout.write(''.join([f'\n{Fore.YELLOW}Sequência:{Style.RESET_ALL} ', postulate_sequence, '\n']))
+        sys.stdout.flush()
 
     else:
         #Geração aleatória
@@ -1523,7 +1811,31 @@ def chose_generate_sequence(separator: str, postulates: dict) -> None:
 
         random_sequence = create_random_sequence(lenght)
         debug_print('\n📝 Exibindo resultado')
-        print(f'\n{Fore.YELLOW}Sequência aleatoria:', random_sequence)
+        sys.stdout.write(''.join([f'\n{Fore.YELLOW}Sequência aleatoria:{Style.RESET_ALL} ', random_sequence, '\n']))
+        sys.stdout.flush()
+
+def _reset(postulates: dict) -> dict:
+    """
+    Repõe os pressupostos no estado inicial (cumpridos e sem mensagens), reaproveitando o mesmo dicionário.
+
+    :Note:
+    - As listas de 'relevants' e 'warnings' são esvaziadas no lugar, em vez de serem criadas de novo a cada análise.
+
+    :param postulates: Dicionário com o estado de conformidade e as mensagens de cada pressuposto.
+    :type postulates: dict
+    :return: O mesmo dicionário `postulates`, já reposto.
+    :rtype: dict
+
+    :Example:
+    >>> postulates = {1: {'comply': False, 'relevants': ['~30.0% é menor que o mínimo permitido ~44.50%'], 'warnings': []}}
+    >>> _reset(postulates)
+    {1: {'comply': True, 'relevants': [], 'warnings': []}}
+    """
+    for postulate in postulates.values():
+        postulate['comply'] = True
+        postulate['relevants'].clear()
+        postulate['warnings'].clear()
+    return postulates
 
 
 #MAIN
@@ -1546,15 +1858,16 @@ if __name__ == '__main__':
     5. Exibe uma tabela-resumo com os três resultados de conformidade (✔ ou ✘).
     6. Permite opcionalmente gerar uma nova sequência binária que satisfaça os pressupostos marcados como "ativos".
     """
+    separator = SEPARATOR
+    postulates = {
+        1: {'comply': True, 'relevants': [], 'warnings': []},
+        2: {'comply': True, 'relevants': [], 'warnings': []},
+        3: {'comply': True, 'relevants': [],'warnings': []}
+    }
+
     while True:
-        separator = '-' * 50
         choice_to_do = beginning_text(separator)
-
-        postulates = {
-            1: {'comply': True, 'relevants': [], 'warnings': []},
-            2: {'comply': True, 'relevants': [], 'warnings': []},
-            3: {'comply': True, 'relevants': [],'warnings': []}
-        }
+        _reset(postulates)
 
         debug_print('\n🧐 Analisando escolha')
 
@@ -1568,6 +1881,7 @@ if __name__ == '__main__':
             debug_print('❌ Escolheu sair do programa')
             break
 
-        choice_restart = input('\n\nDeseja recomeçar? (S/N)')
-        if choice_restart not in 'Ss':
+        choice_restart = _ask('\n\nDeseja recomeçar? (S/N)')
+        # resposta exata; uma resposta vazia sai, em vez de recomeçar
+        if choice_restart not in _YES:
             break